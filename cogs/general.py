@@ -2,6 +2,8 @@ import discord
 from discord.ext import commands
 import time
 
+LIBRARY_VERSION = f"discord.py {discord.__version__}"
+
 class General(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -15,9 +17,9 @@ class General(commands.Cog):
         """
         Returns the bot's latency in milliseconds.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         message = await ctx.send("Testing Ping...")
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         api_latency = round(self.bot.latency * 1000)
         message_latency = round((end_time - start_time) * 1000)
@@ -31,7 +33,7 @@ class General(commands.Cog):
             description="An all-rounder bot built with discord.py",
             color=discord.Color.blue()
         )
-        embed.add_field(name="Library", value=f"discord.py {discord.__version__}", inline=True)
+        embed.add_field(name="Library", value=LIBRARY_VERSION, inline=True)
         embed.add_field(name="Prefix", value="!", inline=True)
         embed.set_footer(text=f"Requested by {ctx.author}")
         await ctx.send(embed=embed)
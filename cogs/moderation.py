@@ -17,7 +17,7 @@ class Moderation(commands.Cog):
             await ctx.send(f'👢 {member.mention} has been kicked. Reason: {reason}')
         except discord.Forbidden:
             await ctx.send("I do not have permission to kick this user.")
-        except Exception as e:
+        except discord.HTTPException as e:
             await ctx.send(f"An error occurred: {e}")
 
     @commands.command(name='ban', help='Bans a member from the server')
@@ -32,7 +32,7 @@ class Moderation(commands.Cog):
             await ctx.send(f'🔨 {member.mention} has been banned. Reason: {reason}')
         except discord.Forbidden:
             await ctx.send("I do not have permission to ban this user.")
-        except Exception as e:
+        except discord.HTTPException as e:
             await ctx.send(f"An error occurred: {e}")
 
     @commands.command(name='clear', aliases=['purge'], help='Clears a specified number of messages')
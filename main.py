@@ -18,7 +18,7 @@ logging.basicConfig(
 logger = logging.getLogger("ChronixBot")
 
 # Load environment variables
-    load_dotenv()
+load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
 OWNER_ID = int(os.getenv('BOT_OWNER_ID')) # Convert to int
 BOT_NAME = os.getenv('BOT_NAME', 'Chronix Bot') # Default to 'Chronix Bot' if not set
@@ -44,13 +44,14 @@ class ChronixBot(commands.Bot):
         It's the perfect place to load extensions.
         """
         logger.info("Loading extensions...")
-        for filename in os.listdir('./cogs'):
-            if filename.endswith('.py'):
-                try:
-                    await self.load_extension(f'cogs.{filename[:-3]}')
-                    logger.info(f'Loaded extension: {filename}')
-                except Exception as e:
-                    logger.error(f'Failed to load extension {filename}.', exc_info=e)
+        with os.scandir('./cogs') as entries:
+            filenames = [entry.name for entry in entries if entry.is_file() and entry.name.endswith('.py')]
+        for filename in filenames:
+            try:
+                await self.load_extension(f'cogs.{filename[:-3]}')
+                logger.info(f'Loaded extension: {filename}')
+            except Exception as e:
+                logger.error(f'Failed to load extension {filename}.', exc_info=e)
         
         logger.info("Syncing command tree...")
         # Sync application commands (slash commands)